@@ -1,18 +1,298 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
-import pytesseract
-from PIL import Image, ImageTk
-from PIL.ExifTags import TAGS
+from PIL import Image
 import re
-from collections import Counter
-import requests
+from collections import Counter, deque
+import heapq
+from operator import itemgetter
 import json
 import threading
+import queue
+import traceback
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import os
+import sqlite3
+from contextlib import closing
+import shutil
+import hashlib
+import io
+import time
 from datetime import datetime
+from types import MappingProxyType
 from tkinterdnd2 import DND_FILES, TkinterDnD
 
 
+# OCRify color scheme - modern blue gradient theme (read-only, shared)
+_COLORS = MappingProxyType({
+    'primary': '#2563eb',      # Modern blue
+    'primary_dark': '#1d4ed8', # Darker blue
+    'secondary': '#f1f5f9',    # Light gray
+    'accent': '#06b6d4',       # Cyan accent
+    'success': '#10b981',      # Green
+    'warning': '#f59e0b',      # Amber
+    'danger': '#ef4444',       # Red
+    'bg_main': '#ffffff',      # White background
+    'bg_secondary': '#f8fafc', # Light background
+    'text_primary': '#1e293b', # Dark text
+    'text_secondary': '#64748b', # Gray text
+    'border': '#e2e8f0',      # Light border
+    'gradient_start': '#3b82f6',
+    'gradient_end': '#1e40af'
+})
+
+# Number of entries kept in the Recent Files menu
+_MAX_RECENT_FILES = 10
+
+# Report separator lines
+_SEP_EQ_30 = "=" * 30
+_SEP_EQ_40 = "=" * 40
+_SEP_EQ_50 = "=" * 50
+_SEP_DASH_20 = "-" * 20
+
+# Whole words made only of ASCII letters (runs touching digits, '_' or accents don't count)
+_WORD_RE = re.compile(r'\b[a-zA-Z]+\b')
+
+# Inputs the compiled word counter must count exactly like _WORD_RE before it is used
+_WORD_COUNT_CHECKS = (
+    "",
+    "Word word WORD wOrD",
+    "end.start,end;(start)--x...y!?z",
+    "a1b2c3 x_y it's 'quoted' \"Double\" tab\tnew\nline",
+    "end—start naïve “curly” café",
+    "On the 3rd and 4th, see Straße 12b or file_name.txt and COVID19",
+    "x_y _lead trail_ 2x x2 ½half ÉCOLE Ürün",
+)
+
+# Number of decoded images kept in memory for quick re-selection
+_IMAGE_CACHE_SIZE = 5
+
+# Maximum size of the image preview in the workspace
+_DISPLAY_SIZE = (400, 300)
+
+# Scaled previews kept in memory, backed by JPEG sidecars on disk
+_THUMBNAIL_CACHE_SIZE = 20
+_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'ocrify')
+_THUMBNAIL_DIR = os.path.join(_CACHE_DIR, 'thumbs')
+
+# Dictionary API responses kept in memory, backed by SQLite on disk
+_DEFINITION_CACHE_SIZE = 512
+_DEFINITION_CACHE_PATH = os.path.join(_CACHE_DIR, 'dict_cache.db')
+
+# Large results are inserted into text widgets in chunks of this many characters
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# EXIF tags shown first in the metadata report, in this order
+_PRIORITY_EXIF_TAGS = ('Make', 'Model', 'DateTime', 'DateTimeOriginal', 'Software',
+                       'ImageWidth', 'ImageLength', 'Orientation', 'XResolution',
+                       'YResolution', 'ResolutionUnit', 'Flash', 'FocalLength',
+                       'ISOSpeedRatings', 'ExposureTime', 'FNumber', 'WhiteBalance')
+_PRIORITY_EXIF_SET = frozenset(_PRIORITY_EXIF_TAGS)
+
+# EXIF MakerNote: opaque vendor blob, often larger than all other tags combined
+_MAKERNOTE_TAG = 37500
+
+# Images are reduced to at most this size before their colors are counted
+_COLOR_SAMPLE_SIZE = (512, 512)
+
+# Metadata for images below both limits is extracted without a worker thread
+_INLINE_METADATA_MAX_BYTES = 64 * 1024
+_INLINE_METADATA_MAX_PIXELS = 1_000_000
+
+# Buffer size for result and metadata files
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Persistent application state (settings and recent files)
+_STATE_DIR = os.path.join(os.path.expanduser('~'), '.ocrify')
+_STATE_PATH = os.path.join(_STATE_DIR, 'state.json')
+
+# Delay before changed settings are written, so bursts of changes coalesce
+_SETTINGS_FLUSH_DELAY_MS = 2000
+
+# Hover time before a tooltip is shown
+_TOOLTIP_DELAY_MS = 400
+
+# OCR is split across worker processes only for pages at least this tall
+_PARALLEL_OCR_MIN_HEIGHT = 1500
+
+# Minimum height of a blank row run that may separate two OCR tiles
+_PARALLEL_OCR_MIN_GAP = 12
+
+
+def _cache_put(cache, key, value, max_size):
+    """Insert into an insertion-ordered dict cache, evicting the oldest entries"""
+    cache.pop(key, None)
+    cache[key] = value
+    while len(cache) > max_size:
+        del cache[next(iter(cache))]
+
+
+def _load_state():
+    """Read the persisted application state, or return an empty one"""
+    try:
+        with open(_STATE_PATH, encoding='utf-8') as f:
+            state = json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def _save_state(state):
+    """Atomically write the application state to disk, ignoring failures"""
+    tmp_path = _STATE_PATH + '.tmp'
+    try:
+        os.makedirs(_STATE_DIR, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(state, indent=2, ensure_ascii=False))
+        os.replace(tmp_path, _STATE_PATH)  # Readers never see a half-written file
+    except OSError:
+        pass
+
+
+def _read_definition_cache(word):
+    """Return the cached dictionary response for a word as JSON text, or None"""
+    try:
+        with closing(sqlite3.connect(_DEFINITION_CACHE_PATH)) as db:
+            row = db.execute("SELECT data FROM definitions WHERE word = ?", (word,)).fetchone()
+    except sqlite3.Error:
+        return None  # No cache yet
+    return row[0] if row else None
+
+
+def _write_definition_cache(word, data_json):
+    """Store a dictionary response on disk, ignoring failures"""
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with closing(sqlite3.connect(_DEFINITION_CACHE_PATH)) as db, db:
+            db.execute("CREATE TABLE IF NOT EXISTS definitions (word TEXT PRIMARY KEY, data TEXT)")
+            db.execute("INSERT OR REPLACE INTO definitions VALUES (?, ?)", (word, data_json))
+    except (OSError, sqlite3.Error):
+        pass  # The cache is an optimization only
+
+
+def _regex_word_frequencies(text):
+    """Return a Counter of the lowercased alphabetic words in text"""
+    return Counter(_WORD_RE.findall(text.lower()))
+
+
+def _init_ocr_worker():
+    """Limit Tesseract to one OpenMP thread per worker; the pool supplies the parallelism"""
+    os.environ['OMP_THREAD_LIMIT'] = '1'
+
+
+def _ocr_tile(image, tesseract_cmd):
+    """Run Tesseract on one page tile (executed in a worker process)"""
+    import pytesseract
+    
+    pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+    return pytesseract.image_to_string(image)
+
+
+def _find_row_gaps(image, min_gap):
+    """Return the middle row of each blank band of at least min_gap rows between text"""
+    # Per-row share of dark pixels: mask the ink, then average each row down to one pixel
+    ink = image.point(lambda p: 255 if p < 128 else 0).convert('F')
+    profile = ink.resize((1, image.height), Image.Resampling.BOX).getdata()
+    
+    gaps = []
+    run_start = None
+    seen_ink = False
+    for y, value in enumerate(profile):
+        if value < 1.5:  # Under ~0.6% dark pixels counts as blank
+            if run_start is None:
+                run_start = y
+            continue
+        if run_start is not None and seen_ink and y - run_start >= min_gap:
+            gaps.append((run_start + y) // 2)
+        run_start = None
+        seen_ink = True
+    return gaps
+
+
+class _DaemonThreadPool:
+    """Reusable worker threads that, unlike ThreadPoolExecutor, never delay interpreter exit"""
+    
+    def __init__(self, max_workers, name_prefix):
+        self._max_workers = max_workers
+        self._name_prefix = name_prefix
+        self._jobs = queue.SimpleQueue()
+        self._idle = threading.Semaphore(0)
+        self._threads = []
+        self._closing = False
+    
+    def submit(self, fn, *args):
+        """Queue fn(*args), starting another worker if none is idle"""
+        if self._closing:
+            return
+        self._jobs.put((fn, args))
+        if not self._idle.acquire(blocking=False) and len(self._threads) < self._max_workers:
+            thread = threading.Thread(target=self._work, daemon=True,
+                                      name=f"{self._name_prefix}_{len(self._threads)}")
+            self._threads.append(thread)
+            thread.start()
+    
+    def shutdown(self):
+        """Drop queued jobs; running ones are abandoned when the process exits"""
+        self._closing = True
+        for _ in self._threads:
+            self._jobs.put(None)
+    
+    def _work(self):
+        while True:
+            job = self._jobs.get()
+            if job is None or self._closing:
+                return
+            fn, args = job
+            try:
+                fn(*args)
+            except Exception:
+                if not self._closing:  # Jobs still running at close fail once Tk is gone
+                    traceback.print_exc()
+            self._idle.release()
+
+
+# Static content of the help dialog
+_HELP_TEXT = """
+OCRify - Advanced OCR Text Extractor & Image Analyzer
+
+KEYBOARD SHORTCUTS:
+• Ctrl+O: Load image
+• Ctrl+E: Extract text
+• Ctrl+M: Extract metadata
+• Ctrl+S: Save results
+• Ctrl+Q: Quit application
+• F1: Show this help
+
+HOW TO USE:
+1. Load an image by clicking "Load Image" or drag & drop an image file
+2. Click "Extract Text" to perform OCR on the loaded image
+3. View results in the tabs: Text, Analytics, and Metadata
+4. Use "Save Results" to export your findings
+
+FEATURES:
+• Text extraction from images using advanced OCR
+• Comprehensive text analytics and word frequency analysis
+• Complete image metadata and EXIF data extraction
+• Drag and drop support for easy file loading
+• Recent files menu for quick access
+• Modern, responsive user interface
+
+SUPPORTED IMAGE FORMATS:
+• PNG, JPG, JPEG, GIF, BMP, TIFF, TIF
+
+TIPS FOR BEST RESULTS:
+• Use high-resolution, clear images
+• Ensure good contrast between text and background
+• Avoid heavily stylized or decorative fonts
+• Make sure the text is horizontally aligned
+
+For technical support or feature requests, please visit our GitHub repository.
+
+OCRify v2.0 - Making text extraction simple and powerful!
+"""
+
+
 class OCRTextExtractor:
     """OCRify - Advanced OCR Text Extractor with Analytics and Metadata Viewer"""
     
@@ -26,13 +306,42 @@ class OCRTextExtractor:
         # Configure modern styling
         self._configure_styles()
         
+        # Single tooltip window shared by all widgets
+        self._tooltip = tk.Toplevel(self.root)
+        self._tooltip.wm_overrideredirect(True)
+        self._tooltip.withdraw()
+        self._tooltip_label = tk.Label(self._tooltip, background=self.colors['text_primary'],
+                                       foreground='white', font=('Segoe UI', 9), padx=5, pady=2)
+        self._tooltip_label.pack()
+        self._tooltip_job = None
+        
+        # Latest chunked insert per text widget, so a newer write cancels an older one
+        self._stream_tokens = {}
+        
         # Application variables
         self.image_path = None
+        self.image_name = None  # Basename of image_path, computed once per load
         self.extracted_text = ""
+        self._word_freq = Counter()  # Word counts of extracted_text, computed off the UI thread
+        self._count_words = _regex_word_frequencies  # Replaced by the Numba kernel once it is ready
         self.image_metadata = {}
         self.original_image = None
-        self.recent_files = []
-        self.settings = {"auto_extract": False, "save_results": True}
+        self._image_cache = {}  # (path, mtime_ns, size) -> (PIL image over the file's bytes, decode lock)
+        self._thumbnail_cache = {}  # (path, mtime_ns, size, width, height) -> scaled PIL image
+        self._original_decode_lock = None  # Decode lock of original_image, kept in its cache entry
+        self.recent_files = deque(maxlen=_MAX_RECENT_FILES)
+        self.settings = {"auto_extract": False, "save_results": True,
+                         "ocr_max_dim": 2500,  # Longest image edge fed to Tesseract (0 = no limit)
+                         "warmup_ocr": True}   # Prime Tesseract's language data at start-up
+        self._ocr_seconds = 0.0
+        self._ocr_executor = None  # Process pool for tiled OCR, created on first use
+        # Long-lived daemon worker threads for OCR, previews, metadata and dictionary lookups
+        self._executor = _DaemonThreadPool(max_workers=4, name_prefix="ocrify")
+        self._settings_dirty = False
+        self._flush_job = None
+        self._definition_cache = {}  # word -> API entries (None if the word is unknown)
+        self._http = None  # requests.Session, created on the first dictionary lookup
+        self._help_window = None  # Built on first use, then reused
         
         # Setup drag and drop
         self.root.drop_target_register(DND_FILES)
@@ -47,8 +356,40 @@ class OCRTextExtractor:
         # Load recent files
         self.load_recent_files()
         
+        # Write pending settings before the window closes
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
         # Set initial focus
         self.root.focus_set()
+        
+        # Warm up Tesseract so the first extraction doesn't pay the cold start
+        if self.settings.get("warmup_ocr", True):
+            self._executor.submit(self._warmup_tesseract)
+        
+        # Import and JIT-compile the word counter in the background, not on first use
+        self._executor.submit(self._load_word_counter)
+    
+    def _warmup_tesseract(self):
+        """Run a tiny OCR pass to load Tesseract and its traineddata into the OS cache"""
+        try:
+            import pytesseract
+            pytesseract.image_to_string(Image.new("L", (4, 4), 255))
+        except Exception:
+            pass  # Missing Tesseract is reported by main() and on extraction
+    
+    def _load_word_counter(self):
+        """Switch to the compiled word counter if it is installed and agrees with the regex path"""
+        try:
+            from analytics import word_frequencies
+        except ImportError:
+            return  # NumPy/Numba not installed, keep the regex path
+        
+        try:
+            # The first call compiles the kernel
+            if all(word_frequencies(text) == _regex_word_frequencies(text) for text in _WORD_COUNT_CHECKS):
+                self._count_words = word_frequencies
+        except Exception:
+            pass  # Keep the regex path if compilation fails
     
     def _configure_styles(self):
         """Configure modern TTK styles with OCRify branding"""
@@ -60,23 +401,7 @@ class OCRTextExtractor:
         except:
             style.theme_use('clam')
         
-        # OCRify color scheme - modern blue gradient theme
-        self.colors = {
-            'primary': '#2563eb',      # Modern blue
-            'primary_dark': '#1d4ed8', # Darker blue
-            'secondary': '#f1f5f9',    # Light gray
-            'accent': '#06b6d4',       # Cyan accent
-            'success': '#10b981',      # Green
-            'warning': '#f59e0b',      # Amber
-            'danger': '#ef4444',       # Red
-            'bg_main': '#ffffff',      # White background
-            'bg_secondary': '#f8fafc', # Light background
-            'text_primary': '#1e293b', # Dark text
-            'text_secondary': '#64748b', # Gray text
-            'border': '#e2e8f0',      # Light border
-            'gradient_start': '#3b82f6',
-            'gradient_end': '#1e40af'
-        }
+        self.colors = _COLORS
         
         # Configure modern styles
         style.configure('Title.TLabel', 
@@ -322,7 +647,8 @@ class OCRTextExtractor:
         freq_frame.columnconfigure(0, weight=1)
         
         self.freq_words_text = scrolledtext.ScrolledText(freq_frame, height=8, wrap=tk.WORD,
-                                                        font=('Consolas', 10))
+                                                        font=('Consolas', 10), state='disabled',
+                                                        undo=False, maxundo=0, autoseparators=False)
         self.freq_words_text.grid(row=0, column=0, sticky=(tk.W, tk.E))
         
         # Unique word analysis
@@ -331,7 +657,8 @@ class OCRTextExtractor:
         unique_frame.columnconfigure(0, weight=1)
         
         self.unique_word_text = scrolledtext.ScrolledText(unique_frame, height=10, wrap=tk.WORD,
-                                                         font=('Consolas', 10))
+                                                         font=('Consolas', 10), state='disabled',
+                                                         undo=False, maxundo=0, autoseparators=False)
         self.unique_word_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
     
     def setup_metadata_tab(self):
@@ -357,7 +684,8 @@ class OCRTextExtractor:
         export_btn.grid(row=0, column=0)
         
         self.metadata_display = scrolledtext.ScrolledText(metadata_frame, wrap=tk.WORD,
-                                                         height=25, font=('Consolas', 10))
+                                                         height=25, font=('Consolas', 10), state='disabled',
+                                                         undo=False, maxundo=0, autoseparators=False)
         self.metadata_display.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
     
     def setup_status_bar(self, parent):
@@ -367,7 +695,8 @@ class OCRTextExtractor:
         status_frame.columnconfigure(1, weight=1)
         
         self.status_var = tk.StringVar()
-        self.status_var.set("✨ Welcome to OCRify! Load an image to get started")
+        self._last_status = None
+        self._set_status("✨ Welcome to OCRify! Load an image to get started")
         
         status_label = ttk.Label(status_frame, textvariable=self.status_var, 
                                style='Status.TLabel', anchor=tk.W)
@@ -378,50 +707,90 @@ class OCRTextExtractor:
                                 style='Status.TLabel', anchor=tk.E)
         version_label.grid(row=0, column=1, sticky=tk.E, padx=10, pady=5)
     
+    def _set_status(self, message):
+        """Update the status bar, skipping the Tk round-trip if nothing changed"""
+        if message != self._last_status:
+            self.status_var.set(message)
+            self._last_status = message
+    
     def setup_shortcuts(self):
         """Setup keyboard shortcuts for better UX"""
-        # Bind both lowercase and uppercase for cross-platform compatibility
-        self.root.bind('<Control-o>', lambda e: self.load_image())
-        self.root.bind('<Control-O>', lambda e: self.load_image())
-        
-        self.root.bind('<Control-e>', lambda e: self.extract_text() if self.extract_btn['state'] == 'normal' else None)
-        self.root.bind('<Control-E>', lambda e: self.extract_text() if self.extract_btn['state'] == 'normal' else None)
-        
-        self.root.bind('<Control-m>', lambda e: self.extract_metadata() if self.metadata_btn['state'] == 'normal' else None)
-        self.root.bind('<Control-M>', lambda e: self.extract_metadata() if self.metadata_btn['state'] == 'normal' else None)
-        
-        self.root.bind('<Control-s>', lambda e: self.save_results() if self.save_btn['state'] == 'normal' else None)
-        self.root.bind('<Control-S>', lambda e: self.save_results() if self.save_btn['state'] == 'normal' else None)
+        shortcuts = {
+            'o': self._on_load_shortcut,
+            'e': self._on_extract_shortcut,
+            'm': self._on_metadata_shortcut,
+            's': self._on_save_shortcut,
+            'q': self._on_quit_shortcut,
+        }
         
-        self.root.bind('<Control-q>', lambda e: self.root.quit())
-        self.root.bind('<Control-Q>', lambda e: self.root.quit())
+        # Bind both lowercase and uppercase for cross-platform compatibility
+        for key, handler in shortcuts.items():
+            self.root.bind(f'<Control-{key}>', handler)
+            self.root.bind(f'<Control-{key.upper()}>', handler)
         
-        self.root.bind('<F1>', lambda e: self.show_help())
+        self.root.bind('<F1>', self._on_help_shortcut)
+    
+    def _on_load_shortcut(self, _event=None):
+        """Handle Ctrl+O"""
+        self.load_image()
+    
+    def _on_extract_shortcut(self, _event=None):
+        """Handle Ctrl+E when extraction is available"""
+        if str(self.extract_btn.cget('state')) == 'normal':
+            self.extract_text()
+    
+    def _on_metadata_shortcut(self, _event=None):
+        """Handle Ctrl+M when metadata extraction is available"""
+        if str(self.metadata_btn.cget('state')) == 'normal':
+            self.extract_metadata()
+    
+    def _on_save_shortcut(self, _event=None):
+        """Handle Ctrl+S when there are results to save"""
+        if str(self.save_btn.cget('state')) == 'normal':
+            self.save_results()
+    
+    def _on_quit_shortcut(self, _event=None):
+        """Handle Ctrl+Q"""
+        self.on_close()
+    
+    def _on_help_shortcut(self, _event=None):
+        """Handle F1"""
+        self.show_help()
     
     def create_tooltip(self, widget, text):
         """Create tooltip for widget"""
         def on_enter(event):
-            tooltip = tk.Toplevel()
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-            label = tk.Label(tooltip, text=text, background=self.colors['text_primary'], 
-                           foreground='white', font=('Segoe UI', 9), padx=5, pady=2)
-            label.pack()
-            widget.tooltip = tooltip
+            self._cancel_tooltip()
+            self._tooltip_job = self.root.after(_TOOLTIP_DELAY_MS, self._show_tooltip, text,
+                                                event.x_root + 10, event.y_root + 10)
         
         def on_leave(event):
-            if hasattr(widget, 'tooltip'):
-                widget.tooltip.destroy()
-                del widget.tooltip
+            self._cancel_tooltip()
+            self._tooltip.withdraw()
         
         widget.bind('<Enter>', on_enter)
         widget.bind('<Leave>', on_leave)
     
+    def _show_tooltip(self, text, x, y):
+        """Show the shared tooltip window at the given screen position"""
+        self._tooltip_job = None
+        self._tooltip_label.configure(text=text)
+        self._tooltip.wm_geometry(f"+{x}+{y}")
+        self._tooltip.deiconify()
+        self._tooltip.lift()
+    
+    def _cancel_tooltip(self):
+        """Cancel a tooltip that is waiting to be shown"""
+        if self._tooltip_job is not None:
+            self.root.after_cancel(self._tooltip_job)
+            self._tooltip_job = None
+    
     def on_file_drop(self, event):
         """Handle drag and drop file events"""
-        files = event.data.split()
+        # Tcl list parse handles braces and paths containing spaces
+        files = self.root.tk.splitlist(event.data)
         if files:
-            file_path = files[0].strip('{}')  # Remove braces if present
+            file_path = files[0]
             if self.is_image_file(file_path):
                 self.load_image_from_path(file_path)
             else:
@@ -439,10 +808,11 @@ class OCRTextExtractor:
         """Load image from a specific file path"""
         try:
             self.image_path = file_path
-            self.original_image = Image.open(file_path)
+            self.image_name = os.path.basename(file_path)
+            self.original_image, self._original_decode_lock = self._open_image(file_path)
             
             # Display image
-            self.display_image(self.original_image)
+            self.display_image(self.original_image, self._original_decode_lock)
             
             # Enable buttons
             self.extract_btn.configure(state='normal')
@@ -455,30 +825,129 @@ class OCRTextExtractor:
             if self.settings.get("auto_extract", False):
                 self.root.after(100, self.extract_text)
             
-            self.status_var.set(f"✅ Image loaded: {os.path.basename(file_path)}")
+            self._set_status(f"✅ Image loaded: {self.image_name}")
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load image: {str(e)}")
             self.root.focus_force()
-            self.status_var.set("❌ Error loading image")
+            self._set_status("❌ Error loading image")
     
-    def display_image(self, image):
-        """Display image in the image label with proper scaling"""
-        # Calculate display size maintaining aspect ratio
-        display_width, display_height = 400, 300
-        img_width, img_height = image.size
+    def _open_image(self, file_path):
+        """Open an image, reusing the cached copy if the file is unchanged
         
-        # Calculate scaling factor
-        scale_w = display_width / img_width
-        scale_h = display_height / img_height
-        scale = min(scale_w, scale_h, 1.0)  # Don't upscale
+        Returns (image, decode_lock); each image has its own lock so decoding one
+        never waits on another.
         
-        new_width = int(img_width * scale)
-        new_height = int(img_height * scale)
+        The file is read into memory and closed at once, so cached images hold no
+        OS handle that would stop the user renaming or deleting them on Windows.
+        Pixel data is decoded lazily (see _decoded) so a preview served from the
+        thumbnail cache never pays for a full decode.
+        """
+        file_stats = os.stat(file_path)
+        key = (file_path, file_stats.st_mtime_ns, file_stats.st_size)
+        entry = self._image_cache.get(key)
+        if entry is None:
+            with open(file_path, 'rb') as f:
+                entry = (Image.open(io.BytesIO(f.read())), threading.Lock())
+        
+        _cache_put(self._image_cache, key, entry, _IMAGE_CACHE_SIZE)
+        return entry
+    
+    def _decoded(self, image, decode_lock):
+        """Return the image with its pixel data loaded, decoding at most once across threads"""
+        with decode_lock:
+            image.load()
+        return image
+    
+    def _thumb_cache_path(self, image_path, mtime_ns, size):
+        """Return the on-disk sidecar path for one version of an image's preview"""
+        # Modification time and size are part of the name, so a replaced file never
+        # matches an old preview, even when its timestamp is older (cp -p, unzip)
+        source = f"{image_path}\0{mtime_ns}\0{size}"
+        digest = hashlib.blake2b(source.encode(), digest_size=16).hexdigest()
+        return os.path.join(_THUMBNAIL_DIR, digest + ".jpg")
+    
+    def _load_thumbnail_sidecar(self, image_path, mtime_ns, size):
+        """Load a cached preview from disk if one exists for this version of the image"""
+        sidecar_path = self._thumb_cache_path(image_path, mtime_ns, size)
+        try:
+            with Image.open(sidecar_path) as thumbnail:
+                thumbnail.load()
+            return thumbnail
+        except OSError:
+            return None
+    
+    def _save_thumbnail_sidecar(self, image_path, mtime_ns, size, thumbnail):
+        """Write a preview to the on-disk cache, ignoring failures"""
+        try:
+            if thumbnail.mode not in ('RGB', 'L'):
+                # JPEG has no alpha channel, so flatten onto the white workspace background
+                rgba = thumbnail.convert('RGBA')
+                thumbnail = Image.new('RGB', rgba.size, 'white')
+                thumbnail.paste(rgba, mask=rgba)
+            
+            os.makedirs(_THUMBNAIL_DIR, exist_ok=True)
+            thumbnail.save(self._thumb_cache_path(image_path, mtime_ns, size), 'JPEG', optimize=True, quality=85)
+        except (OSError, ValueError):
+            pass  # The cache is an optimization only
+    
+    def display_image(self, image, decode_lock):
+        """Display image in the image label, scaling it on a worker thread"""
+        display_width, display_height = _DISPLAY_SIZE
+        file_stats = os.stat(self.image_path)
+        key = (self.image_path, file_stats.st_mtime_ns, file_stats.st_size, display_width, display_height)
+        
+        # Memory tier first, then the sidecar on disk
+        thumbnail = self._thumbnail_cache.get(key)
+        if thumbnail is None:
+            thumbnail = self._load_thumbnail_sidecar(*key[:3])
+        if thumbnail is not None:
+            _cache_put(self._thumbnail_cache, key, thumbnail, _THUMBNAIL_CACHE_SIZE)
+            self._install_thumbnail(thumbnail, self.image_path)
+            return
+        
+        self._executor.submit(self._perform_thumbnail, image, decode_lock, key)
+    
+    def _perform_thumbnail(self, image, decode_lock, key):
+        """Scale the image for display in a separate thread"""
+        image_path, mtime_ns, size, display_width, display_height = key
+        try:
+            if image.format == 'JPEG':
+                # Let libjpeg decode a separate handle at reduced scale; the shared
+                # image stays undecoded (and full resolution) for OCR
+                with Image.open(image_path) as preview:
+                    preview.draft('RGB', (display_width * 2, display_height * 2))
+                    thumbnail = self._compute_thumbnail(preview, display_width, display_height)
+            else:
+                thumbnail = self._compute_thumbnail(self._decoded(image, decode_lock), display_width, display_height)
+            self._save_thumbnail_sidecar(image_path, mtime_ns, size, thumbnail)
+            
+            # Update GUI in main thread
+            self.root.after(0, self._on_thumbnail_ready, key, thumbnail)
+            
+        except Exception as e:
+            error_msg = f"Failed to display image: {str(e)}"
+            self.root.after(0, self._set_status, f"❌ {error_msg}")
+    
+    def _compute_thumbnail(self, image, display_width, display_height):
+        """Return a copy of the image scaled to fit the display area (thread-safe)"""
+        thumbnail = image.copy()
+        thumbnail.thumbnail((display_width, display_height), Image.Resampling.LANCZOS)  # Never upscales
+        return thumbnail
+    
+    def _on_thumbnail_ready(self, key, thumbnail):
+        """Cache a freshly scaled preview and show it (runs on the Tk thread)"""
+        _cache_put(self._thumbnail_cache, key, thumbnail, _THUMBNAIL_CACHE_SIZE)
+        self._install_thumbnail(thumbnail, key[0])
+    
+    def _install_thumbnail(self, thumbnail, image_path):
+        """Show a scaled image in the image label (must run on the Tk thread)"""
+        if image_path != self.image_path:
+            return  # A different image was loaded while this one was scaling
         
-        resized_image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-        photo = ImageTk.PhotoImage(resized_image)
+        from PIL import ImageTk  # Deferred: not needed until the first image is shown
         
+        photo = ImageTk.PhotoImage(thumbnail)
         self.image_label.configure(image=photo, text="", bg='white')
         self.image_label.image = photo  # Keep reference
     
@@ -487,13 +956,15 @@ class OCRTextExtractor:
         self.progress_label.configure(text=message)
         self.progress_frame.grid()
         self.progress_bar.start(10)
-        self.root.update()
+        # Flush pending redraws only; a full update() would also dispatch user
+        # events and could re-enter handlers. The work itself runs on a worker thread.
+        self.root.update_idletasks()
     
     def hide_progress(self):
         """Hide progress indicator"""
         self.progress_bar.stop()
         self.progress_frame.grid_remove()
-        self.root.update()
+        self.root.update_idletasks()
     
     def load_image(self):
         """Enhanced image loading with progress indicator"""
@@ -528,16 +999,17 @@ class OCRTextExtractor:
         self.show_progress("🔍 Extracting text from image...")
         self.extract_btn.configure(state='disabled')
         
-        thread = threading.Thread(target=self._perform_ocr)
-        thread.daemon = True
-        thread.start()
+        self._executor.submit(self._perform_ocr, self.original_image, self._original_decode_lock)
     
-    def _perform_ocr(self):
+    def _perform_ocr(self, image, decode_lock):
         """Enhanced OCR with better error handling"""
         try:
-            # Extract text using Tesseract
-            image = Image.open(self.image_path)
-            self.extracted_text = pytesseract.image_to_string(image)
+            # Extract text using Tesseract on the already decoded image
+            image = self._prepare_for_ocr(self._decoded(image, decode_lock))
+            start = time.perf_counter()
+            self.extracted_text = self._ocr_parallel(image)
+            self._ocr_seconds = time.perf_counter() - start
+            self._word_freq = self._count_words(self.extracted_text)
             
             # Update GUI in main thread
             self.root.after(0, self._update_results)
@@ -546,12 +1018,69 @@ class OCRTextExtractor:
             error_msg = f"OCR extraction failed: {str(e)}\n\nPlease ensure:\n1. Tesseract OCR is properly installed\n2. The image contains readable text\n3. The image quality is sufficient"
             self.root.after(0, lambda: self._show_error(error_msg))
     
+    def _prepare_for_ocr(self, image):
+        """Return a grayscale copy of the image, downscaled if it exceeds the OCR size cap"""
+        if 'A' in image.getbands():
+            # Flatten transparency onto white, as Tesseract would, before dropping alpha
+            rgba = image.convert('RGBA')
+            image = Image.new('RGB', rgba.size, 'white')
+            image.paste(rgba, mask=rgba)
+        
+        # Convert first so the resize works on a single band
+        image = image.convert("L")
+        
+        max_dim = self.settings.get("ocr_max_dim") or 0
+        width, height = image.size
+        scale = min(1.0, max_dim / max(width, height)) if max_dim > 0 else 1.0
+        
+        if scale < 1.0:
+            new_size = (max(1, int(width * scale)), max(1, int(height * scale)))
+            return image.resize(new_size, Image.Resampling.LANCZOS)
+        return image
+    
+    def _ocr_parallel(self, image):
+        """OCR a large page as horizontal tiles in parallel worker processes"""
+        import pytesseract  # Deferred to keep it off the start-up path
+        
+        cpu_count = os.cpu_count() or 1
+        gaps = []
+        if cpu_count > 1 and image.height >= _PARALLEL_OCR_MIN_HEIGHT:
+            gaps = _find_row_gaps(image, _PARALLEL_OCR_MIN_GAP)
+        if not gaps:
+            return pytesseract.image_to_string(image)
+        
+        # Cut at the blank band closest to each evenly spaced split line
+        parts = min(cpu_count, len(gaps) + 1)
+        cuts = []
+        for i in range(1, parts):
+            target = image.height * i // parts
+            cut = min(gaps, key=lambda y: abs(y - target))
+            if not cuts or cut > cuts[-1]:
+                cuts.append(cut)
+        
+        edges = [0] + cuts + [image.height]
+        tiles = [image.crop((0, top, image.width, bottom)) for top, bottom in zip(edges, edges[1:])]
+        
+        # Keep the pool alive between extractions so later calls skip process start-up
+        if self._ocr_executor is None:
+            self._ocr_executor = ProcessPoolExecutor(max_workers=cpu_count,
+                                                     mp_context=multiprocessing.get_context('spawn'),
+                                                     initializer=_init_ocr_worker)
+        
+        tesseract_cmd = pytesseract.pytesseract.tesseract_cmd
+        try:
+            texts = list(self._ocr_executor.map(_ocr_tile, tiles, [tesseract_cmd] * len(tiles)))
+        except BrokenProcessPool:
+            # A worker died; drop the pool so the next extraction starts a fresh one
+            self._ocr_executor = None
+            return pytesseract.image_to_string(image)
+        return "\n".join(text.replace('\f', '').strip('\n') for text in texts)
+    
     def _update_results(self):
         """Enhanced results update with detailed analytics"""
         try:
             # Display extracted text
-            self.text_display.delete(1.0, tk.END)
-            self.text_display.insert(1.0, self.extracted_text)
+            self._stream_insert(self.text_display, self.extracted_text)
             
             # Enhanced text analysis
             self._analyze_text_enhanced()
@@ -559,7 +1088,7 @@ class OCRTextExtractor:
             # Enable save button
             self.save_btn.configure(state='normal')
             
-            self.status_var.set("✅ Text extraction completed successfully")
+            self._set_status(f"✅ Text extraction completed successfully ({self._ocr_seconds:.2f}s)")
             
             # Switch to text tab
             self.notebook.select(0)
@@ -580,73 +1109,104 @@ class OCRTextExtractor:
             self.char_count_label.configure(text="Characters: 0")
             self.line_count_label.configure(text="Lines: 0")
             
-            self.freq_words_text.delete(1.0, tk.END)
-            self.freq_words_text.insert(1.0, "📋 No text extracted from image\n\nPossible reasons:\n- Image contains no readable text\n- Text quality is too poor\n- Language not supported")
-            self.unique_word_text.delete(1.0, tk.END)
-            self.unique_word_text.insert(1.0, "📋 No text available for analysis")
+            self._set_text(self.freq_words_text, "📋 No text extracted from image\n\nPossible reasons:\n- Image contains no readable text\n- Text quality is too poor\n- Language not supported")
+            self._set_text(self.unique_word_text, "📋 No text available for analysis")
             return
         
-        # Enhanced statistics
-        words = re.findall(r'\b[a-zA-Z]+\b', self.extracted_text.lower())
+        # Enhanced statistics (words were counted in the OCR worker thread)
+        word_freq = self._word_freq
+        total_words = sum(word_freq.values())
         characters = len(self.extracted_text)
         lines = len(self.extracted_text.split('\n'))
         
         # Update statistics labels
-        self.word_count_label.configure(text=f"Words: {len(words):,}")
+        self.word_count_label.configure(text=f"Words: {total_words:,}")
         self.char_count_label.configure(text=f"Characters: {characters:,}")
         self.line_count_label.configure(text=f"Lines: {lines:,}")
         
-        if not words:
-            self.freq_words_text.delete(1.0, tk.END)
-            self.freq_words_text.insert(1.0, "🔍 No recognizable words found\n\nThe extracted text may contain:\n- Only numbers or symbols\n- Non-English characters\n- Fragmented text")
-            self.unique_word_text.delete(1.0, tk.END)
-            self.unique_word_text.insert(1.0, "🔍 No valid words for analysis")
+        if not total_words:
+            self._set_text(self.freq_words_text, "🔍 No recognizable words found\n\nThe extracted text may contain:\n- Only numbers or symbols\n- Non-English characters\n- Fragmented text")
+            self._set_text(self.unique_word_text, "🔍 No valid words for analysis")
             return
         
-        # Enhanced frequency analysis
-        word_freq = Counter(words)
-        top_10 = word_freq.most_common(10)
-        
-        freq_text = "🏆 TOP 10 MOST FREQUENT WORDS\n"
-        freq_text += "=" * 40 + "\n\n"
-        freq_text += "Rank │ Word            │ Count │ %\n"
-        freq_text += "─────┼─────────────────┼───────┼──────\n"
+        # Enhanced frequency analysis (bounded heap, no full sort of the vocabulary)
+        top_10 = heapq.nlargest(10, word_freq.items(), key=itemgetter(1))
         
-        total_words = len(words)
+        report_lines = [
+            "🏆 TOP 10 MOST FREQUENT WORDS",
+            _SEP_EQ_40,
+            "",
+            "Rank │ Word            │ Count │ %",
+            "─────┼─────────────────┼───────┼──────",
+        ]
         for i, (word, count) in enumerate(top_10, 1):
             percentage = (count / total_words) * 100
-            freq_text += f"{i:2}.   │ {word:<15} │ {count:>5} │ {percentage:4.1f}%\n"
+            report_lines.append(f"{i:2}.   │ {word:<15} │ {count:>5} │ {percentage:4.1f}%")
+        report_lines.append("")
         
-        self.freq_words_text.delete(1.0, tk.END)
-        self.freq_words_text.insert(1.0, freq_text)
+        self._set_text(self.freq_words_text, "\n".join(report_lines))
         
         # Enhanced unique word analysis
-        unique_words = [word for word, count in word_freq.items() 
-                       if count == 1 and len(word) >= 4]
-        
-        if unique_words:
-            most_unique = max(unique_words, key=len)
-            thread = threading.Thread(target=self._get_word_meaning, args=(most_unique,))
-            thread.daemon = True
-            thread.start()
+        # Longest word (4+ letters) that appears only once, found in a single pass
+        most_unique = None
+        longest = 3
+        for word, count in word_freq.items():
+            if count == 1 and len(word) > longest:
+                most_unique = word
+                longest = len(word)
+        
+        if most_unique:
+            self._executor.submit(self._get_word_meaning, most_unique)
         else:
-            self.unique_word_text.delete(1.0, tk.END)
-            self.unique_word_text.insert(1.0, "🔍 No unique words found\n\nAll words appear multiple times or are shorter than 4 letters.\n\nTry with an image containing more diverse vocabulary.")
+            self._set_text(self.unique_word_text, "🔍 No unique words found\n\nAll words appear multiple times or are shorter than 4 letters.\n\nTry with an image containing more diverse vocabulary.")
+    
+    def _set_text(self, widget, text):
+        """Replace the contents of a read-only results widget"""
+        widget.configure(state='normal')
+        widget.delete('1.0', 'end-1c')
+        widget.insert(1.0, text)
+        widget.configure(state='disabled')
+    
+    def _stream_insert(self, widget, text, read_only=False):
+        """Replace a text widget's contents in chunks so large results don't stall the UI"""
+        chunks = [text[i:i + _STREAM_CHUNK_SIZE] for i in range(0, len(text), _STREAM_CHUNK_SIZE)]
+        token = object()
+        self._stream_tokens[widget] = token
+        
+        widget.configure(state='normal')
+        widget.delete('1.0', 'end-1c')
+        
+        def insert_next(index):
+            if self._stream_tokens.get(widget) is not token:
+                return  # Superseded by a newer write or cleared
+            
+            if index < len(chunks):
+                widget.configure(state='normal')
+                widget.insert(tk.END, chunks[index])
+                widget.configure(state='disabled')  # No editing while the rest streams in
+                self.root.after_idle(insert_next, index + 1)
+            else:
+                del self._stream_tokens[widget]
+                widget.configure(state='disabled' if read_only else 'normal')
+        
+        insert_next(0)
     
     def copy_text(self):
         """Copy extracted text to clipboard"""
         if self.extracted_text:
             self.root.clipboard_clear()
             self.root.clipboard_append(self.extracted_text)
-            self.status_var.set("📋 Text copied to clipboard")
+            self._set_status("📋 Text copied to clipboard")
         else:
             messagebox.showinfo("Info", "No text to copy")
             self.root.focus_force()
     
     def clear_text(self):
         """Clear the text display"""
-        self.text_display.delete(1.0, tk.END)
-        self.status_var.set("🗑️ Text display cleared")
+        self._stream_tokens.pop(self.text_display, None)  # Stop any insert in progress
+        self.text_display.configure(state='normal')  # A cancelled insert leaves it disabled
+        self.text_display.delete('1.0', 'end-1c')
+        self._set_status("🗑️ Text display cleared")
     
     def save_results(self):
         """Save extracted text and metadata to file"""
@@ -678,20 +1238,25 @@ class OCRTextExtractor:
                         'image_path': self.image_path,
                         'timestamp': datetime.now().isoformat()
                     }
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        json.dump(data, f, indent=2, ensure_ascii=False)
+                    # Serialize in memory and write once; json.dump writes per token
+                    payload = json.dumps(data, indent=2, ensure_ascii=False)
+                    with open(filename, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+                        f.write(payload)
                 else:
-                    # Save as text
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        f.write("OCRify - Text Extraction Results\n")
-                        f.write("=" * 40 + "\n\n")
-                        f.write(f"Image: {os.path.basename(self.image_path) if self.image_path else 'Unknown'}\n")
-                        f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                        f.write("EXTRACTED TEXT:\n")
-                        f.write("-" * 20 + "\n")
-                        f.write(self.extracted_text)
+                    # Save as text, built in memory and written once
+                    payload = (
+                        "OCRify - Text Extraction Results\n"
+                        f"{_SEP_EQ_40}\n\n"
+                        f"Image: {self.image_name or 'Unknown'}\n"
+                        f"Date: {datetime.now():%Y-%m-%d %H:%M:%S}\n\n"
+                        "EXTRACTED TEXT:\n"
+                        f"{_SEP_DASH_20}\n"
+                        f"{self.extracted_text}"
+                    )
+                    with open(filename, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+                        f.write(payload)
                         
-                self.status_var.set(f"💾 Results saved to {os.path.basename(filename)}")
+                self._set_status(f"💾 Results saved to {os.path.basename(filename)}")
                 
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save results: {str(e)}")
@@ -715,20 +1280,23 @@ class OCRTextExtractor:
         
         if filename:
             try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(self.image_metadata, f, indent=2, ensure_ascii=False)
-                self.status_var.set(f"📤 Metadata exported to {os.path.basename(filename)}")
+                payload = json.dumps(self.image_metadata, indent=2, ensure_ascii=False)
+                with open(filename, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+                    f.write(payload)
+                self._set_status(f"📤 Metadata exported to {os.path.basename(filename)}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to export metadata: {str(e)}")
                 self.root.focus_force()
     
     def add_to_recent_files(self, file_path):
         """Add file to recent files list"""
-        if file_path in self.recent_files:
+        try:
             self.recent_files.remove(file_path)
-        self.recent_files.insert(0, file_path)
-        self.recent_files = self.recent_files[:10]  # Keep only 10 recent files
+        except ValueError:
+            pass
+        self.recent_files.appendleft(file_path)
         self.update_recent_menu()
+        self._schedule_settings_flush()
     
     def update_recent_menu(self):
         """Update recent files menu"""
@@ -753,12 +1321,42 @@ class OCRTextExtractor:
         """Clear recent files list"""
         self.recent_files.clear()
         self.update_recent_menu()
-        self.status_var.set("🗑️ Recent files cleared")
+        self._schedule_settings_flush()
+        self._set_status("🗑️ Recent files cleared")
     
     def load_recent_files(self):
-        """Load recent files from settings (placeholder)"""
-        # This would load from a config file in a full implementation
-        pass
+        """Load recent files and settings saved by a previous session"""
+        state = _load_state()
+        paths = [path for path in state.get('recent_files', []) if isinstance(path, str)]
+        self.recent_files = deque(paths[:_MAX_RECENT_FILES], maxlen=_MAX_RECENT_FILES)
+        settings = state.get('settings')
+        if isinstance(settings, dict):
+            self.settings.update(settings)
+        self.update_recent_menu()
+    
+    def _schedule_settings_flush(self):
+        """Mark settings as changed and write them after a short delay"""
+        self._settings_dirty = True
+        if self._flush_job is None:
+            self._flush_job = self.root.after(_SETTINGS_FLUSH_DELAY_MS, self._flush_settings)
+    
+    def _flush_settings(self):
+        """Write recent files and settings to disk if they changed"""
+        self._flush_job = None
+        if self._settings_dirty:
+            self._settings_dirty = False
+            _save_state({"recent_files": list(self.recent_files), "settings": self.settings})
+    
+    def on_close(self):
+        """Save pending state and close the application"""
+        if self._flush_job is not None:
+            self.root.after_cancel(self._flush_job)
+        self._flush_settings()
+        
+        self._executor.shutdown()
+        if self._ocr_executor is not None:
+            self._ocr_executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
     
     def show_settings(self):
         """Show settings dialog"""
@@ -797,78 +1395,64 @@ class OCRTextExtractor:
         def save_settings():
             self.settings["auto_extract"] = auto_extract_var.get()
             self.settings["save_results"] = auto_save_var.get()
+            self._schedule_settings_flush()
             settings_window.destroy()
-            self.status_var.set("⚙️ Settings saved")
+            self._set_status("⚙️ Settings saved")
         
         ttk.Button(button_frame, text="Save", command=save_settings).pack(side=tk.RIGHT, padx=(5, 0))
         ttk.Button(button_frame, text="Cancel", command=settings_window.destroy).pack(side=tk.RIGHT)
     
     def show_help(self):
         """Show help dialog with keyboard shortcuts and usage information"""
+        # The dialog is built once and hidden on close, later opens just re-show it
+        if self._help_window is not None:
+            self._place_help_window()
+            self._help_window.deiconify()
+            self._help_window.lift()
+            self._help_window.grab_set()
+            return
+        
         help_window = tk.Toplevel(self.root)
         help_window.title("OCRify Help")
         help_window.geometry("600x500")
         help_window.transient(self.root)
+        help_window.protocol("WM_DELETE_WINDOW", self._hide_help)
+        self._help_window = help_window
+        self._place_help_window()
         help_window.grab_set()
         
-        # Center the window
-        help_window.geometry("+%d+%d" % (
-            self.root.winfo_rootx() + 100,
-            self.root.winfo_rooty() + 100
-        ))
-        
         main_frame = ttk.Frame(help_window, padding="20")
         main_frame.pack(fill=tk.BOTH, expand=True)
         
         ttk.Label(main_frame, text="OCRify Help & Shortcuts", 
                  font=('Segoe UI', 16, 'bold')).pack(pady=(0, 20))
         
-        help_text = scrolledtext.ScrolledText(main_frame, wrap=tk.WORD, height=20, width=70)
-        help_text.pack(fill=tk.BOTH, expand=True)
+        # Plain Text widget without an undo stack; the body is static and read-only
+        body_frame = ttk.Frame(main_frame)
+        body_frame.pack(fill=tk.BOTH, expand=True)
         
-        help_content = """
-OCRify - Advanced OCR Text Extractor & Image Analyzer
-
-KEYBOARD SHORTCUTS:
-• Ctrl+O: Load image
-• Ctrl+E: Extract text
-• Ctrl+M: Extract metadata
-• Ctrl+S: Save results
-• Ctrl+Q: Quit application
-• F1: Show this help
-
-HOW TO USE:
-1. Load an image by clicking "Load Image" or drag & drop an image file
-2. Click "Extract Text" to perform OCR on the loaded image
-3. View results in the tabs: Text, Analytics, and Metadata
-4. Use "Save Results" to export your findings
-
-FEATURES:
-• Text extraction from images using advanced OCR
-• Comprehensive text analytics and word frequency analysis
-• Complete image metadata and EXIF data extraction
-• Drag and drop support for easy file loading
-• Recent files menu for quick access
-• Modern, responsive user interface
-
-SUPPORTED IMAGE FORMATS:
-• PNG, JPG, JPEG, GIF, BMP, TIFF, TIF
-
-TIPS FOR BEST RESULTS:
-• Use high-resolution, clear images
-• Ensure good contrast between text and background
-• Avoid heavily stylized or decorative fonts
-• Make sure the text is horizontally aligned
-
-For technical support or feature requests, please visit our GitHub repository.
-
-OCRify v2.0 - Making text extraction simple and powerful!
-        """
+        help_text = tk.Text(body_frame, wrap=tk.WORD, height=20, width=70, undo=False, maxundo=0)
+        scrollbar = ttk.Scrollbar(body_frame, command=help_text.yview)
+        help_text.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        help_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        help_text.insert(1.0, help_content)
+        help_text.insert(1.0, _HELP_TEXT)
         help_text.configure(state='disabled')
         
-        ttk.Button(main_frame, text="Close", command=help_window.destroy).pack(pady=(10, 0))
+        ttk.Button(main_frame, text="Close", command=self._hide_help).pack(pady=(10, 0))
+    
+    def _place_help_window(self):
+        """Position the help dialog relative to the main window"""
+        self._help_window.geometry("+%d+%d" % (
+            self.root.winfo_rootx() + 100,
+            self.root.winfo_rooty() + 100
+        ))
+    
+    def _hide_help(self):
+        """Hide the help dialog, keeping it for the next time it is opened"""
+        self._help_window.grab_release()
+        self._help_window.withdraw()
     
     def extract_metadata(self):
         """Extract and display image metadata including EXIF data"""
@@ -880,14 +1464,24 @@ OCRify v2.0 - Making text extraction simple and powerful!
         self.show_progress("📋 Extracting image metadata...")
         self.metadata_btn.configure(state='disabled')
         
-        thread = threading.Thread(target=self._perform_metadata_extraction)
-        thread.daemon = True
-        thread.start()
+        try:
+            file_stats = os.stat(self.image_path)
+        except OSError as e:
+            self._show_metadata_error(f"Metadata extraction failed: {str(e)}")
+            return
+        
+        # Small images are quicker to handle inline than to hand to a thread
+        width, height = self.original_image.size
+        if file_stats.st_size < _INLINE_METADATA_MAX_BYTES and width * height <= _INLINE_METADATA_MAX_PIXELS:
+            self._perform_metadata_extraction(file_stats)
+            return
+        
+        self._executor.submit(self._perform_metadata_extraction, file_stats)
     
-    def _perform_metadata_extraction(self):
+    def _perform_metadata_extraction(self, file_stats):
         """Extract metadata in a separate thread"""
         try:
-            metadata = self._get_image_metadata()
+            metadata = self._get_image_metadata(file_stats)
             self.image_metadata = metadata
             
             # Update GUI in main thread
@@ -897,20 +1491,21 @@ OCRify v2.0 - Making text extraction simple and powerful!
             error_msg = f"Metadata extraction failed: {str(e)}"
             self.root.after(0, lambda: self._show_metadata_error(error_msg))
     
-    def _get_image_metadata(self):
+    def _get_image_metadata(self, file_stats):
         """Extract comprehensive metadata from the image"""
+        from PIL.ExifTags import IFD, TAGS, GPSTAGS  # Deferred to keep it off the start-up path
+        
         metadata = {}
         
         try:
-            # Basic file information
-            file_stats = os.stat(self.image_path)
+            # Basic file information (file_stats is the os.stat result of image_path)
             metadata['file_info'] = {
-                'filename': os.path.basename(self.image_path),
+                'filename': self.image_name,
                 'filepath': self.image_path,
                 'file_size': file_stats.st_size,
                 'file_size_mb': round(file_stats.st_size / (1024 * 1024), 2),
-                'created': datetime.fromtimestamp(file_stats.st_ctime).strftime('%Y-%m-%d %H:%M:%S'),
-                'modified': datetime.fromtimestamp(file_stats.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
+                'created': f"{datetime.fromtimestamp(file_stats.st_ctime):%Y-%m-%d %H:%M:%S}",
+                'modified': f"{datetime.fromtimestamp(file_stats.st_mtime):%Y-%m-%d %H:%M:%S}"
             }
             
             # Image properties
@@ -927,28 +1522,43 @@ OCRify v2.0 - Making text extraction simple and powerful!
             # Color information
             if hasattr(self.original_image, 'getcolors'):
                 try:
-                    colors = self.original_image.getcolors(maxcolors=256*256*256)
+                    # Sample a bounded thumbnail instead of hashing every pixel
+                    sample = self._decoded(self.original_image, self._original_decode_lock).copy()
+                    sample.thumbnail(_COLOR_SAMPLE_SIZE, Image.Resampling.BILINEAR)
+                    sample = sample.convert('RGB')  # Report colors as RGB, not palette indices
+                    colors = sample.getcolors(maxcolors=_COLOR_SAMPLE_SIZE[0] * _COLOR_SAMPLE_SIZE[1])
                     if colors:
                         metadata['color_info'] = {
                             'unique_colors': len(colors),
-                            'dominant_color': colors[0][1] if colors else 'Unknown'
+                            'dominant_color': max(colors)[1]  # (count, color) pairs
                         }
                 except:
                     metadata['color_info'] = {'unique_colors': 'Unable to calculate'}
             
-            # EXIF data
+            # EXIF data (IFD0 plus the Exif and GPS sub-IFDs, decoded lazily by Pillow)
             exif_data = {}
-            if hasattr(self.original_image, '_getexif') and self.original_image._getexif():
-                exif = self.original_image._getexif()
-                for tag_id, value in exif.items():
-                    tag = TAGS.get(tag_id, tag_id)
+            exif = self.original_image.getexif()
+            if exif:
+                tags = dict(exif)
+                tags.update(exif.get_ifd(IFD.Exif))
+                tags_get = TAGS.get  # Local alias, resolved once for the whole loop
+                for tag_id, value in tags.items():
+                    tag = tags_get(tag_id, tag_id)
+                    if tag_id == _MAKERNOTE_TAG:
+                        # Don't keep the vendor blob around, just report its size
+                        value = f"<{len(value)} bytes, not decoded>"
                     # Convert bytes to string for display
-                    if isinstance(value, bytes):
+                    elif isinstance(value, bytes):
                         try:
                             value = value.decode('utf-8')
                         except:
                             value = str(value)
                     exif_data[tag] = value
+                
+                gps_info = exif.get_ifd(IFD.GPSInfo)
+                if gps_info:
+                    exif_data['GPSInfo'] = {GPSTAGS.get(tag_id, tag_id): value
+                                            for tag_id, value in gps_info.items()}
             
             metadata['exif_data'] = exif_data
             
@@ -962,10 +1572,9 @@ OCRify v2.0 - Making text extraction simple and powerful!
         try:
             metadata_text = self._format_metadata_text(self.image_metadata)
             
-            self.metadata_display.delete(1.0, tk.END)
-            self.metadata_display.insert(1.0, metadata_text)
+            self._stream_insert(self.metadata_display, metadata_text, read_only=True)
             
-            self.status_var.set("✅ Metadata extraction completed")
+            self._set_status("✅ Metadata extraction completed")
             
             # Switch to metadata tab
             self.notebook.select(2)  # Metadata tab is index 2
@@ -981,143 +1590,188 @@ OCRify v2.0 - Making text extraction simple and powerful!
     
     def _format_metadata_text(self, metadata):
         """Format metadata into a readable text display"""
-        text = "📋 OCRify METADATA REPORT\n"
-        text += "=" * 50 + "\n\n"
+        parts = ["📋 OCRify METADATA REPORT\n", _SEP_EQ_50, "\n\n"]
         
         # File Information
         if 'file_info' in metadata:
             file_info = metadata['file_info']
-            text += "📁 FILE INFORMATION\n"
-            text += "-" * 20 + "\n"
-            text += f"Filename: {file_info.get('filename', 'Unknown')}\n"
-            text += f"File Path: {file_info.get('filepath', 'Unknown')}\n"
-            text += f"File Size: {file_info.get('file_size', 0):,} bytes ({file_info.get('file_size_mb', 0)} MB)\n"
-            text += f"Created: {file_info.get('created', 'Unknown')}\n"
-            text += f"Modified: {file_info.get('modified', 'Unknown')}\n\n"
+            parts.append(
+                "📁 FILE INFORMATION\n"
+                f"{_SEP_DASH_20}\n"
+                f"Filename: {file_info.get('filename', 'Unknown')}\n"
+                f"File Path: {file_info.get('filepath', 'Unknown')}\n"
+                f"File Size: {file_info.get('file_size', 0):,} bytes ({file_info.get('file_size_mb', 0)} MB)\n"
+                f"Created: {file_info.get('created', 'Unknown')}\n"
+                f"Modified: {file_info.get('modified', 'Unknown')}\n\n"
+            )
         
         # Image Properties
         if 'image_info' in metadata:
             img_info = metadata['image_info']
-            text += "🖼️ IMAGE PROPERTIES\n"
-            text += "-" * 20 + "\n"
-            text += f"Format: {img_info.get('format', 'Unknown')}\n"
-            text += f"Color Mode: {img_info.get('mode', 'Unknown')}\n"
-            text += f"Dimensions: {img_info.get('width', 0)} x {img_info.get('height', 0)} pixels\n"
-            text += f"Aspect Ratio: {img_info.get('aspect_ratio', 0)}:1\n"
-            text += f"Megapixels: {img_info.get('megapixels', 0)} MP\n\n"
+            parts.append(
+                "🖼️ IMAGE PROPERTIES\n"
+                f"{_SEP_DASH_20}\n"
+                f"Format: {img_info.get('format', 'Unknown')}\n"
+                f"Color Mode: {img_info.get('mode', 'Unknown')}\n"
+                f"Dimensions: {img_info.get('width', 0)} x {img_info.get('height', 0)} pixels\n"
+                f"Aspect Ratio: {img_info.get('aspect_ratio', 0)}:1\n"
+                f"Megapixels: {img_info.get('megapixels', 0)} MP\n\n"
+            )
         
         # Color Information
         if 'color_info' in metadata:
             color_info = metadata['color_info']
-            text += "🎨 COLOR INFORMATION\n"
-            text += "-" * 20 + "\n"
-            text += f"Unique Colors: {color_info.get('unique_colors', 'Unknown')}\n"
+            parts.append(
+                "🎨 COLOR INFORMATION\n"
+                f"{_SEP_DASH_20}\n"
+                f"Unique Colors (sampled): {color_info.get('unique_colors', 'Unknown')}\n"
+            )
             if 'dominant_color' in color_info and color_info['dominant_color'] != 'Unknown':
-                text += f"Dominant Color: {color_info['dominant_color']}\n"
-            text += "\n"
+                parts.append(f"Dominant Color: {color_info['dominant_color']}\n")
+            parts.append("\n")
         
         # EXIF Data
         if 'exif_data' in metadata and metadata['exif_data']:
-            text += "📷 EXIF DATA\n"
-            text += "-" * 20 + "\n"
-            
-            # Prioritize important EXIF tags
-            priority_tags = ['Make', 'Model', 'DateTime', 'DateTimeOriginal', 'Software', 
-                           'ImageWidth', 'ImageLength', 'Orientation', 'XResolution', 
-                           'YResolution', 'ResolutionUnit', 'Flash', 'FocalLength', 
-                           'ISOSpeedRatings', 'ExposureTime', 'FNumber', 'WhiteBalance']
+            parts.append(f"📷 EXIF DATA\n{_SEP_DASH_20}\n")
             
             exif_data = metadata['exif_data']
             
             # Display priority tags first
-            for tag in priority_tags:
+            for tag in _PRIORITY_EXIF_TAGS:
                 if tag in exif_data:
                     value = exif_data[tag]
-                    text += f"{tag}: {value}\n"
+                    parts.append(f"{tag}: {value}\n")
             
-            # Display other EXIF tags
-            other_tags = [tag for tag in exif_data.keys() if tag not in priority_tags]
+            # Display other EXIF tags (unknown tags are numeric ids, hence key=str)
+            other_tags = sorted(exif_data.keys() - _PRIORITY_EXIF_SET, key=str)
             if other_tags:
-                text += "\nOther EXIF Data:\n"
-                for tag in sorted(other_tags):
+                parts.append("\nOther EXIF Data:\n")
+                for tag in other_tags:
                     value = exif_data[tag]
-                    # Limit very long values
-                    if isinstance(value, str) and len(value) > 50:
-                        value = value[:47] + "..."
-                    text += f"{tag}: {value}\n"
+                    # Limit very long values, whatever their type
+                    text_value = value if isinstance(value, str) else str(value)
+                    if len(text_value) > 50:
+                        text_value = text_value[:47] + "..."
+                    parts.append(f"{tag}: {text_value}\n")
         else:
-            text += "📷 EXIF DATA\n"
-            text += "-" * 20 + "\n"
-            text += "No EXIF data found in this image.\n\n"
+            parts.append(f"📷 EXIF DATA\n{_SEP_DASH_20}\nNo EXIF data found in this image.\n\n")
         
-        return text
+        return "".join(parts)
     
     def _show_metadata_error(self, error_msg):
         """Show metadata extraction error and update status"""
         messagebox.showerror("Metadata Error", error_msg)
         self.root.focus_force()
-        self.status_var.set("❌ Error extracting metadata")
+        self._set_status("❌ Error extracting metadata")
         self.metadata_btn.configure(state='normal')
         self.hide_progress()
     
     def _get_word_meaning(self, word):
         """Get the meaning of a word using a dictionary API"""
+        import requests  # Deferred to keep it off the start-up path
+        
         try:
-            # Using Free Dictionary API
-            url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
-            response = requests.get(url, timeout=5)
+            data = self._fetch_definition(word)
             
-            if response.status_code == 200:
-                data = response.json()
-                
+            if data is not None:
                 # Extract meaning
-                meaning_text = f"🎯 MOST UNIQUE WORD: {word.upper()}\n" + "=" * 30 + "\n\n"
+                parts = [f"🎯 MOST UNIQUE WORD: {word.upper()}\n", _SEP_EQ_30, "\n\n"]
                 
                 if data and len(data) > 0:
                     entry = data[0]
                     
                     # Add phonetic if available
                     if 'phonetic' in entry:
-                        meaning_text += f"Pronunciation: {entry['phonetic']}\n\n"
+                        parts.append(f"Pronunciation: {entry['phonetic']}\n\n")
                     
                     # Add meanings
                     if 'meanings' in entry:
                         for i, meaning in enumerate(entry['meanings'][:2]):  # Limit to 2 meanings
                             part_of_speech = meaning.get('partOfSpeech', 'Unknown')
-                            meaning_text += f"{part_of_speech.upper()}:\n"
+                            parts.append(f"{part_of_speech.upper()}:\n")
                             
                             definitions = meaning.get('definitions', [])
                             for j, definition in enumerate(definitions[:2]):  # Limit to 2 definitions
                                 def_text = definition.get('definition', 'No definition available')
-                                meaning_text += f"  {j+1}. {def_text}\n"
+                                parts.append(f"  {j+1}. {def_text}\n")
                                 
                                 # Add example if available
                                 if 'example' in definition:
-                                    meaning_text += f"     Example: {definition['example']}\n"
-                            meaning_text += "\n"
+                                    parts.append(f"     Example: {definition['example']}\n")
+                            parts.append("\n")
                 else:
-                    meaning_text += "Definition not found in dictionary."
+                    parts.append("Definition not found in dictionary.")
+                
+                meaning_text = "".join(parts)
             else:
-                meaning_text = f"🎯 MOST UNIQUE WORD: {word.upper()}\n" + "=" * 30 + "\n\nDefinition not available\n(Dictionary API returned an error)"
+                meaning_text = f"🎯 MOST UNIQUE WORD: {word.upper()}\n" + _SEP_EQ_30 + "\n\nDefinition not available\n(Dictionary API returned an error)"
                 
         except requests.RequestException:
-            meaning_text = f"🎯 MOST UNIQUE WORD: {word.upper()}\n" + "=" * 30 + "\n\nDefinition not available\n(Network connection error)"
+            meaning_text = f"🎯 MOST UNIQUE WORD: {word.upper()}\n" + _SEP_EQ_30 + "\n\nDefinition not available\n(Network connection error)"
         except Exception as e:
-            meaning_text = f"🎯 MOST UNIQUE WORD: {word.upper()}\n" + "=" * 30 + f"\n\nError getting definition:\n{str(e)}"
+            meaning_text = f"🎯 MOST UNIQUE WORD: {word.upper()}\n" + _SEP_EQ_30 + f"\n\nError getting definition:\n{str(e)}"
         
         # Update GUI in main thread
         self.root.after(0, lambda: self._update_unique_word(meaning_text))
     
+    def _fetch_definition(self, word):
+        """Return the dictionary API entries for a word, or None if unavailable
+        
+        Lookups are served from memory, then from the on-disk cache, and only
+        then from the network. "Not found" answers are cached too.
+        """
+        word = word.lower()
+        if word in self._definition_cache:
+            data = self._definition_cache[word]
+            _cache_put(self._definition_cache, word, data, _DEFINITION_CACHE_SIZE)
+            return data
+        
+        data_json = _read_definition_cache(word)
+        if data_json is None:
+            if self._http is None:
+                self._http = self._create_http_session()
+            
+            # Using Free Dictionary API (separate connect and read timeouts)
+            url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
+            response = self._http.get(url, timeout=(2, 5))
+            
+            if response.status_code == 200:
+                data_json = response.text
+            elif response.status_code == 404:
+                data_json = 'null'  # Unknown word
+            else:
+                return None  # Transient API error, don't cache
+            
+            # Parse before caching so a truncated or non-JSON body is never stored
+            data = json.loads(data_json)
+            _write_definition_cache(word, data_json)
+        else:
+            data = json.loads(data_json)
+        
+        _cache_put(self._definition_cache, word, data, _DEFINITION_CACHE_SIZE)
+        return data
+    
+    def _create_http_session(self):
+        """Create a keep-alive HTTP session with a single retry on gateway errors"""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        retry = Retry(total=1, status_forcelist=[502, 503, 504], backoff_factor=0.2)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        return session
+    
     def _update_unique_word(self, meaning_text):
         """Update the unique word display with meaning"""
-        self.unique_word_text.delete(1.0, tk.END)
-        self.unique_word_text.insert(1.0, meaning_text)
+        self._set_text(self.unique_word_text, meaning_text)
     
     def _show_error(self, error_msg):
         """Show error message and update status"""
         messagebox.showerror("OCRify Error", error_msg)
         self.root.focus_force()
-        self.status_var.set("❌ Error occurred")
+        self._set_status("❌ Error occurred")
         self.extract_btn.configure(state='normal')
         self.hide_progress()
 
@@ -1126,10 +1780,22 @@ def main():
     """
     Main function to initialize and run OCRify
     """
+    import pytesseract
+    
+    # Reuse the Tesseract location found on a previous run to skip the probe
+    state = _load_state()
+    settings = state.get('settings')
+    if not isinstance(settings, dict):
+        settings = state['settings'] = {}
+    cached_cmd = settings.get('tesseract_cmd')
+    
     # Check if Tesseract is available
     tesseract_available = True
     try:
-        pytesseract.get_tesseract_version()
+        if cached_cmd and os.path.exists(cached_cmd):
+            pytesseract.pytesseract.tesseract_cmd = cached_cmd
+        else:
+            pytesseract.get_tesseract_version()
         print("✅ Tesseract OCR is available")
     except Exception as e:
         tesseract_available = False
@@ -1157,6 +1823,13 @@ def main():
             print("\n⚠️ Tesseract not found. Text extraction will be disabled.")
             print("📋 Image metadata extraction will still work.")
     
+    # Remember where Tesseract was found for the next launch
+    if tesseract_available:
+        tesseract_cmd = shutil.which(pytesseract.pytesseract.tesseract_cmd) or pytesseract.pytesseract.tesseract_cmd
+        if tesseract_cmd != cached_cmd and os.path.exists(tesseract_cmd):
+            settings['tesseract_cmd'] = tesseract_cmd
+            _save_state(state)
+    
     try:
         # Check for tkinterdnd2 for drag and drop support
         try:
@@ -1181,7 +1854,7 @@ def main():
         # Disable text extraction if Tesseract is not available
         if not tesseract_available:
             app.extract_btn.configure(state='disabled')
-            app.status_var.set("⚠️ Tesseract OCR not found - Text extraction disabled")
+            app._set_status("⚠️ Tesseract OCR not found - Text extraction disabled")
         
         # Center the window on screen
         root.eval('tk::PlaceWindow . center')
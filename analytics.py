@@ -0,0 +1,104 @@
+"""OCRify - Compiled text analytics kernels (requires NumPy and Numba)"""
+import re
+from collections import Counter
+
+import numpy as np
+from numba import njit
+
+
+# FNV-1a 64-bit hash parameters
+_FNV_OFFSET = np.uint64(14695981039346656037)
+_FNV_PRIME = np.uint64(1099511628211)
+
+# Non-ASCII characters, mapped to ASCII the kernel classifies the same way as re's \w
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7f]')
+
+
+def _to_ascii(match):
+    """Map a Unicode word character to a digit (it spoils its run) and anything else to a space"""
+    return '0' if match.group().isalnum() else ' '
+
+
+@njit(cache=True)
+def _same_word(buf, a, b, length):
+    """Compare two words in the buffer case-insensitively"""
+    for k in range(length):
+        if (buf[a + k] | 0x20) != (buf[b + k] | 0x20):
+            return False
+    return True
+
+
+@njit(cache=True)
+def tokenize_and_count(buf):
+    """Count the alphabetic words of an ASCII byte buffer in a single pass
+
+    Like \\b[a-zA-Z]+\\b, only runs of [A-Za-z0-9_] made entirely of letters count.
+    Returns (offsets, lengths, counts): the first occurrence and length of each
+    distinct word (compared case-insensitively) and how often it appears.
+    """
+    n = buf.size
+
+    # Open-addressing table sized so it is never more than half full
+    capacity = 16
+    while capacity <= n:
+        capacity <<= 1
+    mask = capacity - 1
+    slot_offset = np.full(capacity, -1, np.int64)
+    slot_length = np.zeros(capacity, np.int64)
+    slot_count = np.zeros(capacity, np.int64)
+
+    start = -1
+    letters_only = True
+    h = _FNV_OFFSET
+    for i in range(n + 1):
+        c = np.int64(buf[i]) if i < n else 0
+        lower = c | 0x20
+        if 97 <= lower <= 122:  # [A-Za-z]
+            if start < 0:
+                start = i
+                letters_only = True
+                h = _FNV_OFFSET
+            h = (h ^ np.uint64(lower)) * _FNV_PRIME
+            continue
+        if 48 <= c <= 57 or c == 95:  # [0-9_] extend the run but disqualify it
+            if start < 0:
+                start = i
+            letters_only = False
+            continue
+
+        if start < 0:
+            continue
+        if not letters_only:
+            start = -1
+            continue
+
+        # End of a word: find its slot or claim an empty one
+        length = i - start
+        slot = np.int64(h & np.uint64(mask))
+        while slot_offset[slot] >= 0:
+            if (slot_length[slot] == length
+                    and _same_word(buf, slot_offset[slot], start, length)):
+                break
+            slot = (slot + 1) & mask
+        if slot_offset[slot] < 0:
+            slot_offset[slot] = start
+            slot_length[slot] = length
+        slot_count[slot] += 1
+        start = -1
+
+    used = np.nonzero(slot_offset >= 0)[0]
+    return slot_offset[used], slot_length[used], slot_count[used]
+
+
+def word_frequencies(text):
+    """Return a Counter of the lowercased alphabetic words in text"""
+    text = text.lower()
+    if not text.isascii():
+        text = _NON_ASCII_RE.sub(_to_ascii, text)
+    data = text.encode('ascii')
+    offsets, lengths, counts = tokenize_and_count(np.frombuffer(data, dtype=np.uint8))
+
+    return Counter({
+        data[offset:offset + length].lower().decode('ascii'): count
+        for offset, length, count in zip(offsets.tolist(), lengths.tolist(), counts.tolist())
+    })